@@ -1,8 +1,22 @@
+import asyncio
+
 import streamlit as st
+import numpy as np
 import pandas as pd
 import yfinance as yf
+import yfinance_cache as yfc
 import plotly.graph_objects as go
 
+try:
+    import numbagg
+except ImportError:
+    numbagg = None
+
+try:
+    import bottleneck as bn
+except ImportError:
+    bn = None
+
 # --- PAGE CONFIGURATION ---
 st.set_page_config(
     page_title="Real-Time Stock Market Dashboard",
@@ -21,6 +35,13 @@ TICKERS = [
     'AAPL', 'MSFT', 'GOOGL', 'AMZN', 'TSLA', 'NVDA', 'META', 'JPM', 'V', 'JNJ'
 ]
 
+# Intervals yfinance-cache can cache; it rejects '5d' and only partly handles monthly bars
+CACHED_INTERVALS = {'1m', '2m', '5m', '15m', '30m', '60m', '90m', '1d', '1wk'}
+
+# Candlestick has no WebGL variant, so longer series are bucketed before plotting
+MAX_CANDLES = 2000
+
+
 ticker_symbol = st.sidebar.selectbox("Select a Stock Ticker", TICKERS, index=0)
 
 period = st.sidebar.selectbox(
@@ -40,29 +61,92 @@ if show_ma:
     ma_days_2 = st.sidebar.slider("MA 2 (days)", 5, 100, 50)
 
 # --- DATA FETCHING AND PROCESSING ---
-@st.cache_data(ttl=300)
+def moving_average(close, window):
+    """Rolling mean of a float64 close-price array, using a running-sum kernel when available.
+
+    Returns a plain ndarray that can be handed straight to Plotly.
+    """
+    if numbagg is not None:
+        return numbagg.move_mean(close, window=window, min_count=window)
+    if bn is not None:
+        return bn.move_mean(close, window, min_count=window)
+    return pd.Series(close).rolling(window=window).mean().to_numpy()
+
+def fetch_history(ticker, period, interval):
+    """Fetch split- and dividend-adjusted price history for one ticker."""
+    if interval not in CACHED_INTERVALS:
+        return yf.Ticker(ticker).history(period=period, interval=interval, auto_adjust=True)
+    return yfc.Ticker(ticker).history(
+        period=period, interval=interval, adjust_splits=True, adjust_divs=True
+    )
+
+@st.cache_data(ttl=60)
+def load_all(period, interval):
+    """Prefetch prices for every ticker in TICKERS in one concurrent batch so switching tickers is instant."""
+    async def fetch_all():
+        return await asyncio.gather(
+            *(asyncio.to_thread(fetch_history, ticker, period, interval) for ticker in TICKERS),
+            return_exceptions=True
+        )
+
+    return {
+        ticker: history for ticker, history in zip(TICKERS, asyncio.run(fetch_all()))
+        if not isinstance(history, Exception)
+    }
+
+# Company profile data changes at most daily, so it is cached much longer than prices
+@st.cache_data(ttl=86400)
+def load_info(ticker):
+    """Fetch company profile data for one ticker.
+
+    Raises on failure or an empty response so st.cache_data does not keep it for a day.
+    """
+    info = yfc.Ticker(ticker).info
+    if not info:
+        raise ValueError(f"No company info returned for {ticker}")
+    return info
+
+def safe_load_info(ticker):
+    try:
+        return load_info(ticker)
+    except Exception:
+        return {}
+
 def load_data(ticker, period, interval):
     try:
-        data = yf.download(ticker, period=period, interval=interval, auto_adjust=True)
-        if data.empty:
+        # yfinance-cache persists responses on disk, so repeat loads skip the network
+        data = load_all(period, interval).get(ticker)
+        if data is None or data.empty:
             return None, None
 
         required_columns = ['Open', 'High', 'Low', 'Close']
         if not all(col in data.columns for col in required_columns):
             return None, None
 
-        try:
-            company_info = yf.Ticker(ticker).info
-            if not company_info:
-                company_info = {}
-        except Exception:
-            company_info = {}
-
-        return data, company_info
+        return data, safe_load_info(ticker)
 
     except Exception:
         return None, None
 
+def downsample_ohlc(data, target=MAX_CANDLES):
+    """Merge consecutive bars into about `target` OHLC bars (first/max/min/last)."""
+    bucket_size = -(-len(data) // target)
+    grouped = data.groupby(np.arange(len(data)) // bucket_size)
+    ohlc = pd.DataFrame({
+        'Open': grouped['Open'].first(),
+        'High': grouped['High'].max(),
+        'Low': grouped['Low'].min(),
+        'Close': grouped['Close'].last(),
+    })
+    ohlc.index = data.index[::bucket_size]
+    return ohlc
+
+def plot_dates(index):
+    """Index as wall-clock datetime64 values, so Plotly doesn't rewrap the pandas Index."""
+    if index.tz is not None:
+        index = index.tz_localize(None)
+    return index.values
+
 data, company_info = load_data(ticker_symbol, period, interval)
 
 # --- MAIN DASHBOARD ---
@@ -108,6 +192,7 @@ if data is not None and company_info is not None:
     pe_ratio = company_info.get('trailingPE', 0)
     col4.metric("P/E Ratio", f"{pe_ratio:.2f}" if pe_ratio else "N/A")
 
+    ma_1 = ma_2 = None
     if show_ma:
         data_length = len(data)
 
@@ -119,38 +204,43 @@ if data is not None and company_info is not None:
             st.warning(f"Not enough data for {ma_days_2}-day MA. Using {data_length} days.")
             ma_days_2 = data_length
 
+        # Kept as local arrays: mutating the cached frame would force extra copies
+        close = data['Close'].to_numpy(dtype='float64')
         if ma_days_1 > 0:
-            data[f'MA{ma_days_1}'] = data['Close'].rolling(window=ma_days_1).mean()
+            ma_1 = moving_average(close, ma_days_1)
         if ma_days_2 > 0:
-            data[f'MA{ma_days_2}'] = data['Close'].rolling(window=ma_days_2).mean()
+            ma_2 = moving_average(close, ma_days_2)
 
     # --- PLOTTING ---
     st.subheader("Price Chart")
 
     fig = go.Figure()
 
+    candle_data = downsample_ohlc(data) if len(data) > MAX_CANDLES else data
+
     fig.add_trace(go.Candlestick(
-        x=data.index,
-        open=data['Open'],
-        high=data['High'],
-        low=data['Low'],
-        close=data['Close'],
+        x=plot_dates(candle_data.index),
+        open=candle_data['Open'],
+        high=candle_data['High'],
+        low=candle_data['Low'],
+        close=candle_data['Close'],
         name='Candlestick'
     ))
 
     if show_ma:
-        if f'MA{ma_days_1}' in data.columns:
-            fig.add_trace(go.Scatter(
-                x=data.index,
-                y=data[f'MA{ma_days_1}'],
+        dates = plot_dates(data.index)
+        if ma_1 is not None:
+            fig.add_trace(go.Scattergl(
+                x=dates,
+                y=ma_1,
                 mode='lines',
                 name=f'{ma_days_1}-Day MA',
                 line=dict(color='orange', width=1.5)
             ))
-        if f'MA{ma_days_2}' in data.columns:
-            fig.add_trace(go.Scatter(
-                x=data.index,
-                y=data[f'MA{ma_days_2}'],
+        if ma_2 is not None:
+            fig.add_trace(go.Scattergl(
+                x=dates,
+                y=ma_2,
                 mode='lines',
                 name=f'{ma_days_2}-Day MA',
                 line=dict(color='purple', width=1.5)
@@ -200,5 +290,5 @@ else:
 
 # --- FOOTER ---
 st.markdown("---")
-st.write("Built with ❤️ using Streamlit, Plotly, and yfinance.")
+st.write("Built with ❤️ using Streamlit, Plotly, and yfinance-cache.")
 st.caption("Data provided by Yahoo Finance. This is for educational use only.")
@@ -1,24 +1,70 @@
-import requests
+import asyncio
+import concurrent.futures
+from concurrent.futures.process import BrokenProcessPool
+import contextlib
+import functools
+import multiprocessing
+import threading
+from multiprocessing import util as mp_util
+import httpx
 from bs4 import BeautifulSoup
 from selenium import webdriver
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
 from selenium.webdriver.chrome.options import Options
-from selenium.common.exceptions import TimeoutException, WebDriverException
+from selenium.common.exceptions import (
+    InvalidSelectorException, JavascriptException, TimeoutException, WebDriverException
+)
 import pandas as pd
 import sqlite3
 import schedule
 import time
 import json
 import logging
+import re
 from datetime import datetime, timedelta
-from typing import List, Dict, Any, Optional
+from urllib.parse import urlsplit
+from typing import List, Dict, Any, Optional, Union
 import csv
 import os
 from dataclasses import dataclass
 from abc import ABC, abstractmethod
 
+try:
+    import lxml.html
+    from lxml import etree
+    from cssselect import HTMLTranslator
+except ImportError:
+    etree = None
+
+try:
+    import h2  # noqa: F401 -- lets httpx negotiate HTTP/2
+    HTTP2_AVAILABLE = True
+except ImportError:
+    HTTP2_AVAILABLE = False
+
+# selectolax 1.0 removed the Modest backend (selectolax.parser); Lexbor has the same API
+try:
+    from selectolax.lexbor import LexborHTMLParser as HTMLParser
+except ImportError:
+    try:
+        from selectolax.parser import HTMLParser
+    except ImportError:
+        HTMLParser = None
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    import pyarrow as pa
+    import pyarrow.csv as pa_csv
+    import pyarrow.parquet as pq
+except ImportError:
+    pa = None
+
 # Configure logging
 logging.basicConfig(
     level=logging.INFO,
@@ -38,12 +84,13 @@ class ScrapeConfig:
     url: str
     scrape_type: str  # 'static' or 'dynamic'
     selectors: Dict[str, str]
-    schedule_interval: str  # '5min', '1hour', '1day', etc.
-    output_format: str  # 'csv', 'json', 'database'
+    schedule_interval: str  # '30sec', '5min', '1hour', '1day', '2week'
+    output_format: str  # 'csv', 'parquet', 'json', 'database'
     max_retries: int = 3
     timeout: int = 30
     headers: Optional[Dict[str, str]] = None
     wait_for_element: Optional[str] = None  # CSS selector to wait for (dynamic scraping)
+    block_assets: bool = True  # Skip loading images and fonts (dynamic scraping)
 
 
 class BaseScraper(ABC):
@@ -51,9 +98,6 @@ class BaseScraper(ABC):
 
     def __init__(self, config: ScrapeConfig):
         self.config = config
-        self.session = requests.Session()
-        if config.headers:
-            self.session.headers.update(config.headers)
 
     @abstractmethod
     def scrape(self) -> List[Dict[str, Any]]:
@@ -73,59 +117,220 @@ class BaseScraper(ABC):
                     raise
 
 
-class StaticScraper(BaseScraper):
-    """Scraper for static websites using BeautifulSoup"""
+@functools.lru_cache(maxsize=None)
+def compile_css(selector: str, prefix: str = 'descendant-or-self::'):
+    """Translate a CSS selector into a compiled lxml XPath, once per process"""
+    return etree.XPath(HTMLTranslator().css_to_xpath(selector, prefix=prefix))
 
-    def scrape(self) -> List[Dict[str, Any]]:
-        logger.info(f"Starting static scrape of {self.config.url}")
 
-        response = self.session.get(self.config.url, timeout=self.config.timeout)
-        response.raise_for_status()
+# Connection pool sizes for the static scrapers' HTTP clients
+HTTP_LIMITS = httpx.Limits(max_connections=50, max_keepalive_connections=20)
+
+
+class StaticParserMixin:
+    """Container and field extraction shared by the static scrapers
 
-        soup = BeautifulSoup(response.content, 'html.parser')
+    Uses lxml with precompiled selectors when available, then selectolax,
+    then BeautifulSoup.
+    """
+
+    @staticmethod
+    def _extract_field(container, selector: Union[str, 'etree.XPath']) -> Optional[str]:
+        """Get the href, src or text of the first element matching selector"""
+        if etree is not None:
+            matches = selector(container)
+            if not matches:
+                return None
+            element = matches[0]
+            # Strip each text node and join, matching BeautifulSoup's get_text(strip=True)
+            text = ''.join(part.strip() for part in element.itertext())
+            return element.get('href') or element.get('src') or text
+
+        if HTMLParser is not None:
+            element = container.css_first(selector)
+            if element is None:
+                return None
+            attributes = element.attributes
+            return attributes.get('href') or attributes.get('src') or element.text(strip=True)
+
+        element = container.select_one(selector)
+        if element:
+            # Try to get text, href, or src attribute
+            if element.get('href'):
+                return element.get('href')
+            elif element.get('src'):
+                return element.get('src')
+            else:
+                return element.get_text(strip=True)
+        return None
+
+    def _parse(self, content: bytes, encoding: Optional[str] = None) -> List[Dict[str, Any]]:
+        """Extract one item per container from the page content
+
+        encoding is the response's charset; without it lxml assumes Latin-1
+        for pages that have no <meta charset>.
+        """
         data = []
 
         # Find all elements that match the first selector (usually container elements)
         container_selector = list(self.config.selectors.keys())[0]
-        containers = soup.select(container_selector)
+        if etree is not None:
+            try:
+                document = lxml.html.document_fromstring(
+                    content, parser=lxml.html.HTMLParser(encoding=encoding)
+                )
+            except etree.ParserError:
+                # Empty pages, or ones holding only comments, have no document element
+                return data
+            containers = compile_css(container_selector)(document)
+        elif HTMLParser is not None:
+            containers = HTMLParser(content).css(container_selector)
+        else:
+            containers = BeautifulSoup(content, 'html.parser').select(container_selector)
+
+        # Resolve the field list and timestamp once rather than per container
+        field_items = tuple(
+            (field, selector) for field, selector in self.config.selectors.items()
+            if field != container_selector
+        )
+        if etree is not None:
+            field_items = tuple(
+                (field, compile_css(selector, prefix='descendant::')) for field, selector in field_items
+            )
+        scraped_at = datetime.now().isoformat()
 
         for container in containers:
             item = {}
-            item['scraped_at'] = datetime.now().isoformat()
+            item['scraped_at'] = scraped_at
             item['url'] = self.config.url
 
             # Extract data using remaining selectors
-            for field, selector in self.config.selectors.items():
-                if field == container_selector:
-                    continue
-
-                element = container.select_one(selector)
-                if element:
-                    # Try to get text, href, or src attribute
-                    if element.get('href'):
-                        item[field] = element.get('href')
-                    elif element.get('src'):
-                        item[field] = element.get('src')
-                    else:
-                        item[field] = element.get_text(strip=True)
-                else:
-                    item[field] = None
+            for field, selector in field_items:
+                item[field] = self._extract_field(container, selector)
 
             data.append(item)
 
-        logger.info(f"Static scrape completed. Found {len(data)} items")
         return data
 
 
-class DynamicScraper(BaseScraper):
-    """Scraper for dynamic websites using Selenium"""
+class StaticScraper(StaticParserMixin, BaseScraper, contextlib.AbstractContextManager):
+    """Scraper for static websites; call close() or use it as a context manager"""
 
     def __init__(self, config: ScrapeConfig):
         super().__init__(config)
-        self.driver = None
+        # HTTP/2 (when h2 is installed) lets repeated requests share one connection
+        self.session = httpx.Client(
+            http2=HTTP2_AVAILABLE,
+            follow_redirects=True,
+            limits=HTTP_LIMITS,
+            headers=config.headers
+        )
+
+    def close(self):
+        """Close the HTTP client and its pooled connections"""
+        self.session.close()
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    def scrape(self) -> List[Dict[str, Any]]:
+        logger.info(f"Starting static scrape of {self.config.url}")
+
+        response = self.session.get(self.config.url, timeout=self.config.timeout)
+        response.raise_for_status()
+
+        data = self._parse(response.content, response.encoding)
+        logger.info(f"Static scrape completed. Found {len(data)} items")
+        return data
+
+
+class AsyncStaticScraper(StaticParserMixin, BaseScraper):
+    """Static scraper whose scrape() and retry_scrape() are coroutines
+
+    Fetches through an httpx.AsyncClient owned by the caller, so jobs on one
+    event loop share its connection pool and HTTP/2 connections.
+    """
+
+    def __init__(self, config: ScrapeConfig, session: httpx.AsyncClient):
+        super().__init__(config)
+        self.session = session
+
+    async def scrape(self) -> List[Dict[str, Any]]:
+        logger.info(f"Starting async static scrape of {self.config.url}")
+
+        response = await self.session.get(
+            self.config.url, headers=self.config.headers, timeout=self.config.timeout
+        )
+        response.raise_for_status()
+
+        # Parse in the default thread pool so other jobs' I/O keeps running
+        loop = asyncio.get_running_loop()
+        data = await loop.run_in_executor(None, self._parse, response.content, response.encoding)
+        logger.info(f"Static scrape completed. Found {len(data)} items")
+        return data
+
+    async def retry_scrape(self) -> List[Dict[str, Any]]:
+        """Retry scraping with exponential backoff"""
+        for attempt in range(self.config.max_retries):
+            try:
+                return await self.scrape()
+            except Exception as e:
+                logger.warning(f"Scraping attempt {attempt + 1} failed: {str(e)}")
+                if attempt < self.config.max_retries - 1:
+                    await asyncio.sleep(2 ** attempt)  # Exponential backoff
+                else:
+                    raise
+
+
+# Extracts every field of every container in-page, so a scrape costs one
+# WebDriver round trip instead of one per container and field
+BATCH_EXTRACT_JS = """
+const [containerSelector, fieldSelectors] = arguments;
+return Array.from(document.querySelectorAll(containerSelector), container => {
+    const row = {};
+    for (const [field, selector] of Object.entries(fieldSelectors)) {
+        const element = container.querySelector(selector);
+        row[field] = element ? (element.href || element.src || element.innerText.trim()) : null;
+    }
+    return row;
+});
+"""
+
+# Resources that never affect scraped text. Stylesheets are still loaded
+# because innerText depends on computed styles. Patterns match the whole URL,
+# so each extension is blocked at the end of the path or before a query string.
+BLOCKED_ASSET_EXTENSIONS = (
+    'png', 'jpg', 'jpeg', 'gif', 'webp', 'svg', 'ico',
+    'woff', 'woff2', 'ttf', 'otf',
+)
+BLOCKED_ASSET_URLS = [
+    pattern
+    for extension in BLOCKED_ASSET_EXTENSIONS
+    for pattern in (f'*.{extension}', f'*.{extension}?*')
+]
+
+
+class DynamicScraper(BaseScraper, contextlib.AbstractContextManager):
+    """Scraper for dynamic websites using Selenium
+
+    One headless Chrome is shared by every instance in the process and reused
+    across scrapes; call close() to shut it down.
+    """
+
+    _driver = None
+    _default_user_agent = None
+    _driver_lock = threading.RLock()
+    _finalizer_registered = False
+
+    @property
+    def driver(self):
+        return DynamicScraper._driver
 
     def _setup_driver(self):
-        """Setup Chrome driver with options"""
+        """Start the shared Chrome driver if it is not already running"""
+        if DynamicScraper._driver is not None:
+            return
+
         chrome_options = Options()
         chrome_options.add_argument('--headless')
         chrome_options.add_argument('--no-sandbox')
@@ -133,71 +338,165 @@ class DynamicScraper(BaseScraper):
         chrome_options.add_argument('--disable-gpu')
         chrome_options.add_argument('--window-size=1920,1080')
 
-        # Add user agent if specified in headers
-        if self.config.headers and 'User-Agent' in self.config.headers:
-            chrome_options.add_argument(f'--user-agent={self.config.headers["User-Agent"]}')
+        driver = webdriver.Chrome(options=chrome_options)
+        driver.implicitly_wait(10)
+        DynamicScraper._driver = driver
+        DynamicScraper._default_user_agent = driver.execute_script('return navigator.userAgent')
 
-        self.driver = webdriver.Chrome(options=chrome_options)
-        self.driver.implicitly_wait(10)
+        # Runs at interpreter exit, including in process-pool workers where atexit does not
+        if not DynamicScraper._finalizer_registered:
+            mp_util.Finalize(None, DynamicScraper.close, exitpriority=10)
+            DynamicScraper._finalizer_registered = True
 
-    def scrape(self) -> List[Dict[str, Any]]:
-        logger.info(f"Starting dynamic scrape of {self.config.url}")
-
-        try:
-            self._setup_driver()
-            self.driver.get(self.config.url)
-
-            # Wait for specific element if configured
-            if self.config.wait_for_element:
-                WebDriverWait(self.driver, self.config.timeout).until(
-                    EC.presence_of_element_located((By.CSS_SELECTOR, self.config.wait_for_element))
-                )
+    @staticmethod
+    def close():
+        """Quit the shared Chrome driver, if one is running"""
+        with DynamicScraper._driver_lock:
+            if DynamicScraper._driver is not None:
+                try:
+                    DynamicScraper._driver.quit()
+                finally:
+                    DynamicScraper._driver = None
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    def _reset_browser_state(self):
+        """Clear the last scrape's cookies (all domains) and site storage
+
+        Storage is cleared for the configured URL's origin and the origin the
+        page ended on after redirects; storage written by iframes on other
+        origins is not.
+        """
+        driver = self.driver
+        origins = set()
+        for url in (self.config.url, driver.current_url):
+            parts = urlsplit(url)
+            if parts.scheme in ('http', 'https'):
+                origins.add(f'{parts.scheme}://{parts.netloc}')
+        for origin in origins:
+            driver.execute_cdp_cmd('Storage.clearDataForOrigin', {
+                'origin': origin,
+                'storageTypes': 'all'
+            })
+        # delete_all_cookies() only covers the current domain; this clears third-party ones too
+        driver.execute_cdp_cmd('Network.clearBrowserCookies', {})
+        driver.get('about:blank')
+
+    def _extract_per_element(self, container_selector: str,
+                             field_selectors: Dict[str, str]) -> List[Dict[str, Any]]:
+        """Extract fields with one WebDriver call per element (slow fallback path)"""
+        rows = []
+        containers = self.driver.find_elements(By.CSS_SELECTOR, container_selector)
 
-            # Allow time for dynamic content to load
-            time.sleep(2)
+        for container in containers:
+            row = {}
+            for field, selector in field_selectors.items():
+                try:
+                    element = container.find_element(By.CSS_SELECTOR, selector)
 
-            data = []
+                    # Try to get text, href, or src attribute
+                    if element.get_attribute('href'):
+                        row[field] = element.get_attribute('href')
+                    elif element.get_attribute('src'):
+                        row[field] = element.get_attribute('src')
+                    else:
+                        row[field] = element.text.strip()
+                except Exception:
+                    row[field] = None
 
-            # Find all elements that match the first selector
-            container_selector = list(self.config.selectors.keys())[0]
-            containers = self.driver.find_elements(By.CSS_SELECTOR, container_selector)
+            rows.append(row)
 
-            for container in containers:
-                item = {}
-                item['scraped_at'] = datetime.now().isoformat()
-                item['url'] = self.config.url
+        return rows
 
-                # Extract data using remaining selectors
-                for field, selector in self.config.selectors.items():
-                    if field == container_selector:
-                        continue
+    def scrape(self) -> List[Dict[str, Any]]:
+        logger.info(f"Starting dynamic scrape of {self.config.url}")
 
+        # The shared driver serves one scrape at a time
+        with DynamicScraper._driver_lock:
+            try:
+                self._setup_driver()
+
+                # Headers differ per job, so the user agent is set per scrape
+                user_agent = (self.config.headers or {}).get('User-Agent', DynamicScraper._default_user_agent)
+                self.driver.execute_cdp_cmd('Network.setUserAgentOverride', {'userAgent': user_agent})
+
+                # The blocklist is reset every scrape since the browser is shared
+                blocked_urls = BLOCKED_ASSET_URLS if self.config.block_assets else []
+                self.driver.execute_cdp_cmd('Network.enable', {})
+                self.driver.execute_cdp_cmd('Network.setBlockedURLs', {'urls': blocked_urls})
+
+                self.driver.get(self.config.url)
+
+                # Wait for specific element if configured
+                if self.config.wait_for_element:
+                    WebDriverWait(self.driver, self.config.timeout).until(
+                        EC.presence_of_element_located((By.CSS_SELECTOR, self.config.wait_for_element))
+                    )
+
+                # Allow time for dynamic content to load
+                time.sleep(2)
+
+                # Find all elements that match the first selector
+                container_selector = list(self.config.selectors.keys())[0]
+                field_selectors = {
+                    field: selector for field, selector in self.config.selectors.items()
+                    if field != container_selector
+                }
+
+                try:
+                    rows = self.driver.execute_script(BATCH_EXTRACT_JS, container_selector, field_selectors)
+                except JavascriptException as e:
+                    logger.warning(f"Batch extraction failed, falling back to per-element lookups: {str(e)}")
+                    rows = self._extract_per_element(container_selector, field_selectors)
+
+                data = []
+                scraped_at = datetime.now().isoformat()
+                for row in rows:
+                    item = {}
+                    item['scraped_at'] = scraped_at
+                    item['url'] = self.config.url
+                    item.update(row)
+                    data.append(item)
+
+                logger.info(f"Dynamic scrape completed. Found {len(data)} items")
+                return data
+
+            except (TimeoutException, InvalidSelectorException):
+                # Page or configuration problems; the browser itself is fine
+                raise
+            except WebDriverException:
+                # Don't reuse a browser session that may be broken
+                self.close()
+                raise
+
+            finally:
+                if self.driver:
                     try:
-                        element = container.find_element(By.CSS_SELECTOR, selector)
-
-                        # Try to get text, href, or src attribute
-                        if element.get_attribute('href'):
-                            item[field] = element.get_attribute('href')
-                        elif element.get_attribute('src'):
-                            item[field] = element.get_attribute('src')
-                        else:
-                            item[field] = element.text.strip()
-                    except Exception:
-                        item[field] = None
-
-                data.append(item)
-
-            logger.info(f"Dynamic scrape completed. Found {len(data)} items")
-            return data
-
-        finally:
-            if self.driver:
-                self.driver.quit()
+                        self._reset_browser_state()
+                    except Exception as e:
+                        # Don't mask the scrape's own outcome; drop the browser instead
+                        logger.warning(f"Could not reset browser state, restarting Chrome: {str(e)}")
+                        # close() always drops the shared driver, even if quit() fails
+                        with contextlib.suppress(Exception):
+                            self.close()
 
 
 class DataExporter:
     """Handle data export to various formats"""
 
+    @staticmethod
+    def _columns(data: List[Dict[str, Any]]) -> List[str]:
+        """Every key seen in any row, in first-seen order, as pandas does"""
+        return list(dict.fromkeys(key for row in data for key in row))
+
+    @staticmethod
+    def _to_arrow(data: List[Dict[str, Any]]) -> 'pa.Table':
+        """Build an Arrow table with a column for every key seen in any row"""
+        # Table.from_pylist only takes columns from the first row
+        columns = DataExporter._columns(data)
+        return pa.table({column: [row.get(column) for row in data] for column in columns})
+
     @staticmethod
     def to_csv(data: List[Dict[str, Any]], filename: str):
         """Export data to CSV"""
@@ -205,15 +504,38 @@ class DataExporter:
             logger.warning("No data to export to CSV")
             return
 
-        df = pd.DataFrame(data)
-        df.to_csv(filename, index=False)
+        # pyarrow's columnar writer avoids pandas' per-value string formatting.
+        # Unlike pandas, it quotes the header and every string value.
+        if pa is not None:
+            pa_csv.write_csv(DataExporter._to_arrow(data), filename)
+        else:
+            df = pd.DataFrame(data)
+            df.to_csv(filename, index=False)
         logger.info(f"Data exported to CSV: {filename}")
 
+    @staticmethod
+    def to_parquet(data: List[Dict[str, Any]], filename: str):
+        """Export data to Parquet"""
+        if not data:
+            logger.warning("No data to export to Parquet")
+            return
+
+        if pa is None:
+            raise ImportError("Parquet export requires pyarrow: pip install pyarrow")
+
+        pq.write_table(DataExporter._to_arrow(data), filename)
+        logger.info(f"Data exported to Parquet: {filename}")
+
     @staticmethod
     def to_json(data: List[Dict[str, Any]], filename: str):
         """Export data to JSON"""
-        with open(filename, 'w', encoding='utf-8') as f:
-            json.dump(data, f, indent=2, ensure_ascii=False)
+        if orjson is not None:
+            # orjson emits UTF-8 bytes directly, matching ensure_ascii=False
+            with open(filename, 'wb') as f:
+                f.write(orjson.dumps(data, option=orjson.OPT_INDENT_2))
+        else:
+            with open(filename, 'w', encoding='utf-8') as f:
+                json.dump(data, f, indent=2, ensure_ascii=False)
         logger.info(f"Data exported to JSON: {filename}")
 
     @staticmethod
@@ -223,12 +545,67 @@ class DataExporter:
             logger.warning("No data to export to database")
             return
 
-        conn = sqlite3.connect(db_name)
-        df = pd.DataFrame(data)
-        df.to_sql(table_name, conn, if_exists='append', index=False)
-        conn.close()
+        columns = DataExporter._columns(data)
+        column_list = ', '.join(f'"{column}"' for column in columns)
+        column_defs = ', '.join(f'"{column}" TEXT' for column in columns)
+        placeholders = ', '.join('?' * len(columns))
+        rows = [tuple(item.get(column) for column in columns) for item in data]
+
+        # Autocommit mode so the bulk insert runs in one explicit transaction
+        conn = sqlite3.connect(db_name, isolation_level=None)
+        try:
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            conn.execute(f'CREATE TABLE IF NOT EXISTS "{table_name}" ({column_defs})')
+            conn.execute("BEGIN")
+            conn.executemany(
+                f'INSERT INTO "{table_name}" ({column_list}) VALUES ({placeholders})',
+                rows
+            )
+            conn.execute("COMMIT")
+        except Exception:
+            if conn.in_transaction:
+                conn.execute("ROLLBACK")
+            raise
+        finally:
+            conn.close()
         logger.info(f"Data exported to database: {db_name}, table: {table_name}")
 
+    @staticmethod
+    def export(config: ScrapeConfig, data: List[Dict[str, Any]]):
+        """Export data in the job's configured output format"""
+        timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
+
+        if config.output_format == 'csv':
+            filename = f"{config.name}_{timestamp}.csv"
+            DataExporter.to_csv(data, filename)
+        elif config.output_format == 'parquet':
+            filename = f"{config.name}_{timestamp}.parquet"
+            DataExporter.to_parquet(data, filename)
+        elif config.output_format == 'json':
+            filename = f"{config.name}_{timestamp}.json"
+            DataExporter.to_json(data, filename)
+        elif config.output_format == 'database':
+            db_name = f"{config.name}.db"
+            DataExporter.to_database(data, db_name, config.name)
+
+
+def run_dynamic_job(config: ScrapeConfig):
+    """Scrape and export a dynamic job; module-level so it can be pickled into a worker process"""
+    data = DynamicScraper(config).retry_scrape()
+    DataExporter.export(config, data)
+
+
+# Schedule intervals look like '30sec', '5min', '1hour', '1day' or '2week'
+SCHEDULE_INTERVAL_RE = re.compile(r'([1-9]\d*)(sec|min|hour|day|week)')
+SCHEDULE_UNITS = {
+    'sec': 'seconds',
+    'min': 'minutes',
+    'hour': 'hours',
+    'day': 'days',
+    'week': 'weeks',
+}
+
 
 class WebScraperScheduler:
     """Main scheduler class for web scraping jobs"""
@@ -236,80 +613,143 @@ class WebScraperScheduler:
     def __init__(self):
         self.jobs: Dict[str, ScrapeConfig] = {}
         self.running = False
+        self.stop_event = threading.Event()
+
+        # Worker processes for dynamic jobs, created on the first dynamic run
+        self.pool: Optional[concurrent.futures.ProcessPoolExecutor] = None
+
+        # Event loop shared by all static jobs, run in a background thread
+        self.loop = asyncio.new_event_loop()
+        self.loop_thread = threading.Thread(target=self.loop.run_forever, daemon=True)
+        self.loop_thread.start()
+        self.http_client = None
 
     def add_job(self, config: ScrapeConfig):
         """Add a scraping job to the scheduler"""
+        # Validate before storing so rejected jobs are neither listed nor run
+        match = SCHEDULE_INTERVAL_RE.fullmatch(config.schedule_interval)
+        if not match:
+            logger.error(f"Invalid schedule interval: {config.schedule_interval}")
+            return
+
         self.jobs[config.name] = config
 
         # Schedule the job based on interval
-        if config.schedule_interval.endswith('min'):
-            minutes = int(config.schedule_interval[:-3])
-            schedule.every(minutes).minutes.do(self._run_job, config.name)
-        elif config.schedule_interval.endswith('hour'):
-            hours = int(config.schedule_interval[:-4])
-            schedule.every(hours).hours.do(self._run_job, config.name)
-        elif config.schedule_interval.endswith('day'):
-            days = int(config.schedule_interval[:-3])
-            schedule.every(days).days.do(self._run_job, config.name)
-        else:
-            logger.error(f"Invalid schedule interval: {config.schedule_interval}")
+        count, unit = int(match.group(1)), match.group(2)
+        getattr(schedule.every(count), SCHEDULE_UNITS[unit]).do(self._run_job, config.name)
 
         logger.info(f"Job '{config.name}' added with interval: {config.schedule_interval}")
 
-    def _run_job(self, job_name: str):
-        """Run a specific scraping job"""
+    async def _run_static_job(self, job_name: str):
+        """Run a static scraping job on the scheduler's event loop"""
         config = self.jobs[job_name]
-        logger.info(f"Running job: {job_name}")
 
-        try:
-            # Choose scraper based on type
-            if config.scrape_type == 'static':
-                scraper = StaticScraper(config)
-            else:
-                scraper = DynamicScraper(config)
+        # Created lazily so the client is bound to the loop it runs on
+        if self.http_client is None:
+            self.http_client = httpx.AsyncClient(
+                http2=HTTP2_AVAILABLE, follow_redirects=True, limits=HTTP_LIMITS
+            )
 
-            # Scrape data
-            data = scraper.retry_scrape()
+        try:
+            data = await AsyncStaticScraper(config, self.http_client).retry_scrape()
+            await self.loop.run_in_executor(None, DataExporter.export, config, data)
+            logger.info(f"Job '{job_name}' completed successfully")
 
-            # Export data
-            timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
+        except Exception as e:
+            logger.error(f"Job '{job_name}' failed: {str(e)}")
 
-            if config.output_format == 'csv':
-                filename = f"{job_name}_{timestamp}.csv"
-                DataExporter.to_csv(data, filename)
-            elif config.output_format == 'json':
-                filename = f"{job_name}_{timestamp}.json"
-                DataExporter.to_json(data, filename)
-            elif config.output_format == 'database':
-                db_name = f"{job_name}.db"
-                DataExporter.to_database(data, db_name, job_name)
+    def _run_job(self, job_name: str):
+        """Run a specific scraping job"""
+        config = self.jobs[job_name]
+        logger.info(f"Running job: {job_name}")
 
-            logger.info(f"Job '{job_name}' completed successfully")
+        # Static jobs are handed to the event loop so pending ones run concurrently
+        if config.scrape_type == 'static':
+            return asyncio.run_coroutine_threadsafe(self._run_static_job(job_name), self.loop)
 
-        except Exception as e:
+        # Dynamic jobs run in worker processes so each Chrome session gets its own core
+        pool = self._get_pool()
+        try:
+            future = pool.submit(run_dynamic_job, config)
+        except BrokenProcessPool as e:
             logger.error(f"Job '{job_name}' failed: {str(e)}")
+            self._discard_pool(pool)
+            return None
+        future.add_done_callback(lambda f: self._log_job_result(job_name, f, pool))
+        return future
+
+    def _get_pool(self) -> concurrent.futures.ProcessPoolExecutor:
+        """Create the worker pool, sized to the dynamic jobs, on first use"""
+        if self.pool is None:
+            dynamic_jobs = sum(1 for config in self.jobs.values() if config.scrape_type != 'static')
+            # Spawn rather than fork: the scheduler already runs the event loop thread
+            self.pool = concurrent.futures.ProcessPoolExecutor(
+                max_workers=max(1, min(os.cpu_count() or 1, dynamic_jobs)),
+                mp_context=multiprocessing.get_context('spawn')
+            )
+        return self.pool
+
+    def _discard_pool(self, pool: concurrent.futures.ProcessPoolExecutor):
+        """Drop a pool that lost a worker so the next dynamic job starts a fresh one"""
+        # A broken pool rejects every later submit
+        if self.pool is pool:
+            self.pool = None
+        pool.shutdown(wait=False)
+
+    def _log_job_result(self, job_name: str, future: concurrent.futures.Future,
+                        pool: concurrent.futures.ProcessPoolExecutor):
+        """Log the outcome of a job run in the process pool"""
+        error = future.exception()
+        if error:
+            logger.error(f"Job '{job_name}' failed: {str(error)}")
+            if isinstance(error, BrokenProcessPool):
+                self._discard_pool(pool)
+        else:
+            logger.info(f"Job '{job_name}' completed successfully")
 
     def run_job_now(self, job_name: str):
         """Run a specific job immediately"""
         if job_name in self.jobs:
-            self._run_job(job_name)
+            future = self._run_job(job_name)
+            if future is not None:
+                concurrent.futures.wait([future])
         else:
             logger.error(f"Job '{job_name}' not found")
 
     def start_scheduler(self):
         """Start the scheduler"""
         self.running = True
+        self.stop_event.clear()
         logger.info("Scheduler started")
 
         while self.running:
+            idle = schedule.idle_seconds()
+            if idle is None:
+                logger.warning("No jobs scheduled, stopping scheduler")
+                self.running = False
+                break
+
+            # Sleep until the next job is due; stop_scheduler() wakes this immediately
+            if idle > 0 and self.stop_event.wait(min(idle, 60)):
+                break
             schedule.run_pending()
-            time.sleep(1)
 
     def stop_scheduler(self):
         """Stop the scheduler"""
         self.running = False
+        self.stop_event.set()
         logger.info("Scheduler stopped")
 
+    def shutdown(self):
+        """Stop the scheduler and release worker processes, the event loop and Chrome"""
+        self.stop_scheduler()
+        if self.pool is not None:
+            self.pool.shutdown(wait=True)
+        if self.http_client is not None:
+            asyncio.run_coroutine_threadsafe(self.http_client.aclose(), self.loop).result()
+        self.loop.call_soon_threadsafe(self.loop.stop)
+        DynamicScraper.close()
+
     def list_jobs(self):
         """List all configured jobs"""
         for name, config in self.jobs.items():
@@ -385,6 +825,8 @@ def main():
     # Start the scheduler (commented out for demo)
     # scheduler.start_scheduler()
 
+    scheduler.shutdown()
+
 
 if __name__ == "__main__":
     main()
\ No newline at end of file